@@ -3,28 +3,37 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 from pathlib import Path
 import sys
 from types import ModuleType
 from typing import Any
 
-import plotly.io as pio
 import streamlit as st
-import toml
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
+PAGES_DIR = Path(__file__).parent / "pages"
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from src.utils.secrets import get_env_bool, load_env
 
 
-def _load_config(path: str = "config.toml") -> dict[str, Any]:
+@st.cache_data(show_spinner=False)
+def _parse_config(path: str, mtime_ns: int) -> dict[str, Any]:
+    import toml
+
     with open(path, "r", encoding="utf-8") as handle:
         return toml.load(handle)
 
 
-def _resolve_page_module(path: Path) -> ModuleType:
+def _load_config(path: str = "config.toml") -> dict[str, Any]:
+    # This script is re-executed on every rerun, so the parsed config is kept in
+    # Streamlit's cache and refreshed only when the file changes.
+    return _parse_config(path, os.stat(path).st_mtime_ns)
+
+
+def _load_page_module(path: Path) -> ModuleType:
     spec = importlib.util.spec_from_file_location(path.stem, path)
     if spec is None or spec.loader is None:
         raise ImportError(f"Cannot import page at {path}")
@@ -33,6 +42,18 @@ def _resolve_page_module(path: Path) -> ModuleType:
     return module
 
 
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _cached_page_module(path: str, mtime_ns: int) -> ModuleType:
+    return _load_page_module(Path(path))
+
+
+def _resolve_page_module(path: Path) -> ModuleType:
+    # The app script is re-executed on every rerun, so loaded pages are kept in
+    # Streamlit's process-wide resource cache, shared by all sessions, and only
+    # re-imported when their source file changes.
+    return _cached_page_module(str(path), path.stat().st_mtime_ns)
+
+
 def _available_pages(is_admin: bool) -> list[dict[str, Any]]:
     pages: list[dict[str, Any]] = []
     if is_admin:
@@ -40,14 +61,14 @@ def _available_pages(is_admin: bool) -> list[dict[str, Any]]:
             {
                 "title": "Admin → Ingest",
                 "icon": "🛠️",
-                "path": Path(__file__).parent / "pages" / "1_Admin_Ingest.py",
+                "path": PAGES_DIR / "1_Admin_Ingest.py",
             }
         )
     pages.append(
         {
             "title": "Simulations",
             "icon": "🛫",
-            "path": Path(__file__).parent / "pages" / "2_Simulations.py",
+            "path": PAGES_DIR / "2_Simulations.py",
         }
     )
     return pages
@@ -85,8 +106,12 @@ def main() -> None:
         page_icon="✈️",
     )
 
+    import plotly.io as pio
+
     is_admin = get_env_bool("IS_ADMIN")
     pio.templates.default = config["app"].get("plotly_template", "plotly_dark")
+    # st.plotly_chart serializes through plotly.io.to_json; orjson is a dependency.
+    pio.json.config.default_engine = "orjson"
     st.session_state["app_context"] = {"config": config, "is_admin": is_admin}
 
     pages = _available_pages(is_admin)
@@ -0,0 +1,49 @@
+"""Optional Numba kernel for the synthetic OTP outcome flags.
+
+Enabled with ``AVI_NUMBA=1`` when Numba is importable. The kernel draws the
+per-flight cancelled/diverted outcomes for every airport block in parallel;
+it uses Numba's own generator, so the synthetic outcomes differ from (but are
+as deterministic as) the NumPy path.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from src.utils.secrets import get_env_bool
+
+try:  # pragma: no cover - exercised only when numba is installed
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+
+def enabled() -> bool:
+    """Return whether the Numba kernel should be used."""
+
+    return numba is not None and get_env_bool("AVI_NUMBA")
+
+
+def _gen_flags(
+    seed_per_airport: np.ndarray,
+    n_per_airport: np.ndarray,
+    cancel_rates: np.ndarray,
+    divert_rates: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    offsets = np.zeros(n_per_airport.size + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(n_per_airport)
+    cancelled = np.empty(cancel_rates.size, dtype=np.int8)
+    diverted = np.empty(divert_rates.size, dtype=np.int8)
+    for block in numba.prange(n_per_airport.size):
+        # Seeding per block keeps each airport's draws independent of thread scheduling.
+        np.random.seed(seed_per_airport[block])
+        for row in range(offsets[block], offsets[block + 1]):
+            cancelled[row] = np.random.random() < cancel_rates[row]
+            diverted[row] = np.random.random() < divert_rates[row]
+    return cancelled, diverted
+
+
+if numba is not None:  # pragma: no cover
+    gen_flags = numba.njit(parallel=True, cache=True)(_gen_flags)
+else:  # pragma: no cover
+    gen_flags = None
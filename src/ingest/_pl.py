@@ -0,0 +1,82 @@
+"""Optional Polars backend for the daily ingest aggregations.
+
+Enabled with ``AVI_POLARS=1`` when Polars is importable. Both helpers take the
+long pandas frames prepared by the pandas code paths and return frames with the
+same columns, order and dtypes, so callers can switch backends transparently.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from src.utils.secrets import get_env_bool
+
+try:  # pragma: no cover - exercised only when polars is installed
+    import polars as pl
+except ImportError:  # pragma: no cover
+    pl = None
+
+
+def enabled() -> bool:
+    """Return whether the Polars backend should be used."""
+
+    return pl is not None and get_env_bool("AVI_POLARS")
+
+
+def daily_metar_features_pl(df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate flagged METAR observations per ``date``/``airport`` with Polars."""
+
+    frame = pl.from_pandas(
+        df[["date", "airport", "wind_speed_kt", "wind_gust_kt", "visibility_statute_mi", "ceiling_ft_agl", "_precip", "_ts", "_ifr"]]
+    )
+    daily = (
+        frame.group_by(["date", "airport"])
+        .agg(
+            pl.col("wind_speed_kt").mean().alias("wind_mean"),
+            pl.col("wind_gust_kt").max().alias("gust_max"),
+            pl.col("visibility_statute_mi").min().alias("vis_min"),
+            pl.col("ceiling_ft_agl").min().alias("ceiling_min"),
+            pl.col("_precip").max().alias("precip_any"),
+            pl.col("_ts").max().alias("ts_any"),
+            pl.col("_ifr").max().alias("ifr_any"),
+        )
+        .sort(["date", "airport"])
+        .to_pandas()
+    )
+    return daily.astype({"date": df["date"].dtype, "airport": df["airport"].dtype})
+
+
+def daily_movements_pl(stacked: pd.DataFrame) -> pd.DataFrame:
+    """Count departures and movements per ``airport``/``date`` with Polars.
+
+    ``stacked`` holds one row per airport-side of a flight with a categorical
+    ``airport``, a ``date`` and a boolean ``departure`` role column.
+    """
+
+    frame = pl.DataFrame(
+        {
+            "airport": stacked["airport"].cat.codes.to_numpy(),
+            # Polars has no second-resolution datetimes; the unit is restored below.
+            "date": stacked["date"].to_numpy().astype("datetime64[us]"),
+            "departure": stacked["departure"].to_numpy(),
+        }
+    )
+    counts = (
+        frame.group_by(["airport", "date"])
+        .agg(pl.col("departure").sum().alias("dep_count"), pl.len().alias("movements"))
+        .sort(["airport", "date"])
+    )
+    index = pd.MultiIndex.from_arrays(
+        [
+            pd.Categorical.from_codes(counts["airport"].to_numpy(), dtype=stacked["airport"].dtype),
+            pd.Index(counts["date"].to_numpy()).astype(stacked["date"].dtype),
+        ],
+        names=["airport", "date"],
+    )
+    return pd.DataFrame(
+        {
+            "dep_count": counts["dep_count"].to_numpy().astype("int64"),
+            "movements": counts["movements"].to_numpy().astype("int64"),
+        },
+        index=index,
+    )
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Iterable
 
 import numpy as np
 import pandas as pd
 import requests
 
-from src.utils.http import build_session, get_csv
+from src.ingest import _pl
+from src.utils.http import get_csv_cached, shared_session
 
 BASE_URL = "https://aviationweather.gov/adds/dataserver_current/httpparam"
+BATCH_MAX_WORKERS = 8
 
 
 def _default_headers(user_agent: str | None) -> dict[str, str]:
@@ -18,7 +22,7 @@ def _default_headers(user_agent: str | None) -> dict[str, str]:
 
 
 def _download_metar(
-    airport: str,
+    stations: str,
     start: str,
     end: str,
     user_agent: str | None,
@@ -28,12 +32,12 @@ def _download_metar(
         "dataSource": "metars",
         "requestType": "retrieve",
         "format": "csv",
-        "stationString": airport,
+        "stationString": stations,
         "startTime": f"{start}T00:00:00Z",
         "endTime": f"{end}T23:59:59Z",
     }
-    http = session or build_session(user_agent)
-    data = get_csv(BASE_URL, params=params, headers=_default_headers(user_agent), session=http)
+    http = session or shared_session(user_agent)
+    data = get_csv_cached(BASE_URL, params=params, headers=_default_headers(user_agent), session=http)
     if data.empty:
         raise ValueError("No METAR data returned")
     return data
@@ -42,24 +46,20 @@ def _download_metar(
 def _synthetic_metar(airport: str, start: str, end: str) -> pd.DataFrame:
     start_dt = datetime.fromisoformat(start)
     end_dt = datetime.fromisoformat(end)
-    records: list[dict] = []
     rng = np.random.default_rng(abs(hash(airport)) % (2**32))
-    current = start_dt
-    while current <= end_dt + timedelta(days=1):
-        records.append(
-            {
-                "station_id": airport,
-                "observation_time": current,
-                "wind_speed_kt": max(0, rng.normal(8, 4)),
-                "wind_gust_kt": max(0, rng.normal(18, 6)),
-                "visibility_statute_mi": max(0.25, rng.normal(8, 2)),
-                "ceiling_ft_agl": max(100, rng.normal(4000, 800)),
-                "wx_string": rng.choice(["", "RA", "TSRA", "BR"], p=[0.6, 0.2, 0.1, 0.1]),
-                "flight_category": rng.choice(["VFR", "MVFR", "IFR", "LIFR"], p=[0.6, 0.2, 0.15, 0.05]),
-            }
-        )
-        current += timedelta(hours=1)
-    return pd.DataFrame.from_records(records)
+    hours = max(int((end_dt + timedelta(days=1) - start_dt) // timedelta(hours=1)) + 1, 0)
+    return pd.DataFrame(
+        {
+            "station_id": airport,
+            "observation_time": pd.date_range(start_dt, periods=hours, freq="h"),
+            "wind_speed_kt": np.maximum(0, rng.normal(8, 4, hours)),
+            "wind_gust_kt": np.maximum(0, rng.normal(18, 6, hours)),
+            "visibility_statute_mi": np.maximum(0.25, rng.normal(8, 2, hours)),
+            "ceiling_ft_agl": np.maximum(100, rng.normal(4000, 800, hours)),
+            "wx_string": rng.choice(["", "RA", "TSRA", "BR"], size=hours, p=[0.6, 0.2, 0.1, 0.1]),
+            "flight_category": rng.choice(["VFR", "MVFR", "IFR", "LIFR"], size=hours, p=[0.6, 0.2, 0.15, 0.05]),
+        }
+    )
 
 
 def fetch_metar(
@@ -78,13 +78,50 @@ def fetch_metar(
         return _synthetic_metar(airport, start, end)
 
 
+def fetch_metar_batch(
+    airports: Iterable[str],
+    start: str,
+    end: str,
+    user_agent: str,
+    session: requests.Session | None = None,
+    max_workers: int = BATCH_MAX_WORKERS,
+) -> dict[str, pd.DataFrame]:
+    """Fetch raw METAR observations for several airports with one request.
+
+    ADDS accepts a space-separated ``stationString``; the combined CSV is split
+    back per ``station_id``. Airports missing from an otherwise successful
+    response are re-requested individually on a thread pool sharing one
+    session, falling back to synthetic observations like :func:`fetch_metar`.
+    If the combined request fails outright, every airport is synthetic.
+    """
+
+    airports = list(airports)
+    stations: dict[str, pd.DataFrame] = {}
+    try:
+        data = _download_metar(" ".join(airports), start, end, user_agent, session=session)
+    except Exception:
+        return {airport: _synthetic_metar(airport, start, end) for airport in airports}
+    if "station_id" in data.columns:
+        stations = {
+            str(station): group.reset_index(drop=True)
+            for station, group in data.groupby("station_id", sort=False)
+        }
+    missing = [airport for airport in dict.fromkeys(airports) if airport not in stations]
+    if missing:
+        http = session or shared_session(user_agent)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as executor:
+            results = executor.map(lambda airport: fetch_metar(airport, start, end, user_agent, session=http), missing)
+            stations.update(zip(missing, results))
+    return {airport: stations[airport] for airport in airports}
+
+
 def _normalize_metar(df: pd.DataFrame) -> pd.DataFrame:
     """Standardize METAR dataframe column names."""
 
     columns = df.columns.str.lower()
     df = df.copy()
     df.columns = columns
-    if "observation_time" in df.columns:
+    if "observation_time" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["observation_time"]):
         df["observation_time"] = pd.to_datetime(df["observation_time"])
     if "wind_speed_kt" not in df.columns:
         df["wind_speed_kt"] = df.get("wind_speed", 0)
@@ -127,30 +164,36 @@ def daily_metar_features(metar_df: pd.DataFrame) -> pd.DataFrame:
     if "observation_time" not in df.columns:
         raise ValueError("METAR data is missing observation_time column")
 
-    df["date"] = pd.to_datetime(df["observation_time"]).dt.date
+    # Group on naive midnight timestamps (int64-backed) rather than Python date
+    # objects; the same datetime64 column is what downstream consumers receive.
+    # ``_normalize_metar`` has already parsed observation_time.
+    dates = df["observation_time"].dt.normalize()
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    df["date"] = dates
     df["airport"] = df.get("station_id", "")
 
-    aggregations = {
-        "wind_speed_kt": "mean",
-        "wind_gust_kt": "max",
-        "visibility_statute_mi": "min",
-        "ceiling_ft_agl": "min",
-    }
-    grouped = df.groupby(["date", "airport"]).agg(aggregations).rename(columns={
-        "wind_speed_kt": "wind_mean",
-        "wind_gust_kt": "gust_max",
-        "visibility_statute_mi": "vis_min",
-        "ceiling_ft_agl": "ceiling_min",
-    })
-
-    flags = df.groupby(["date", "airport"]).agg(
-        precip_any=("wx_string", lambda s: int(any(s.str.contains("RA|SN|DZ", case=False, na=False)))),
-        ts_any=("wx_string", lambda s: int(any(s.str.contains("TS", case=False, na=False)))),
-        ifr_any=("flight_category", lambda s: int(any(s.isin(["IFR", "LIFR"])))),
-    )
-
-    daily = grouped.join(flags)
-    daily.reset_index(inplace=True)
+    # Weather flags are evaluated once over the whole frame; "any" per day is
+    # then a plain max in the same groupby as the numeric aggregates.
+    wx_string = df["wx_string"].astype(str)
+    # int8 flags keep the *_any outputs at one byte per row.
+    df["_precip"] = wx_string.str.contains("RA|SN|DZ", case=False, na=False).astype("int8")
+    df["_ts"] = wx_string.str.contains("TS", case=False, na=False).astype("int8")
+    df["_ifr"] = df["flight_category"].isin(["IFR", "LIFR"]).astype("int8")
+
+    if _pl.enabled():
+        daily = _pl.daily_metar_features_pl(df)
+    else:
+        daily = df.groupby(["date", "airport"]).agg(
+            wind_mean=("wind_speed_kt", "mean"),
+            gust_max=("wind_gust_kt", "max"),
+            vis_min=("visibility_statute_mi", "min"),
+            ceiling_min=("ceiling_ft_agl", "min"),
+            precip_any=("_precip", "max"),
+            ts_any=("_ts", "max"),
+            ifr_any=("_ifr", "max"),
+        )
+        daily.reset_index(inplace=True)
     return daily[[
         "date",
         "airport",
@@ -10,18 +10,21 @@ pipeline would execute.
 
 from __future__ import annotations
 
+import functools
 from datetime import datetime
 from typing import Iterable
 
 import numpy as np
 import pandas as pd
 
+from src.ingest import _numba_otp, _pl
 from src.utils.dates import date_range
-from src.utils.http import build_session, get_json
+from src.utils.http import get_json, shared_session
 
 SAMPLE_URL = "https://raw.githubusercontent.com/vega/vega-datasets/master/data/flights-5k.json"
 
 
+@functools.lru_cache(maxsize=4096)
 def _icao_to_iata(airport: str) -> str:
     """Convert a four-letter ICAO identifier to a three-letter IATA code."""
 
@@ -33,8 +36,7 @@ def _icao_to_iata(airport: str) -> str:
 def _download_sample() -> pd.DataFrame:
     """Download a small public flight sample."""
 
-    session = build_session()
-    data = get_json(SAMPLE_URL, session=session)
+    data = get_json(SAMPLE_URL, session=shared_session())
     df = pd.DataFrame(data)
     df["FlightDate"] = pd.to_datetime(df["date"]).dt.date
     df.rename(columns={"origin": "Origin", "destination": "Dest"}, inplace=True)
@@ -44,41 +46,71 @@ def _download_sample() -> pd.DataFrame:
 
 
 def _synthetic_rows(airports: Iterable[str], start: str, end: str) -> pd.DataFrame:
-    """Generate deterministic synthetic flight rows for offline usage."""
+    """Generate deterministic synthetic flight rows for offline usage.
+
+    Each airport contributes a block of departures followed by a block of
+    arrivals per day. Daily counts, rates and per-flight outcomes are sampled
+    as whole arrays and expanded with ``np.repeat``. With ``AVI_NUMBA=1`` the
+    per-flight outcomes are drawn afterwards by the parallel Numba kernel.
+    """
 
     start_date = datetime.fromisoformat(str(start)).date()
     end_date = datetime.fromisoformat(str(end)).date()
-    records: list[dict] = []
+    days = np.array(list(date_range(start_date, end_date)), dtype=object)
+    columns: dict[str, list[np.ndarray]] = {name: [] for name in ("FlightDate", "Origin", "Dest", "Cancelled", "Diverted")}
+    use_numba = _numba_otp.enabled()
+    seeds: list[int] = []
     for airport in airports:
-        rng = np.random.default_rng(abs(hash(airport)) % (2**32))
-        for day in date_range(start_date, end_date):
-            departures = int(rng.normal(350, 40))
-            arrivals = int(rng.normal(340, 40))
-            departures = max(departures, 50)
-            arrivals = max(arrivals, 50)
-            cancel_rate = 0.02 + 0.01 * rng.random()
-            divert_rate = 0.005 * rng.random()
-            for _ in range(departures):
-                records.append(
-                    {
-                        "FlightDate": day,
-                        "Origin": _icao_to_iata(airport),
-                        "Dest": "ZZZ",
-                        "Cancelled": int(rng.random() < cancel_rate),
-                        "Diverted": int(rng.random() < divert_rate),
-                    }
-                )
-            for _ in range(arrivals):
-                records.append(
-                    {
-                        "FlightDate": day,
-                        "Origin": "ZZZ",
-                        "Dest": _icao_to_iata(airport),
-                        "Cancelled": int(rng.random() < cancel_rate),
-                        "Diverted": int(rng.random() < divert_rate),
-                    }
-                )
-    return pd.DataFrame.from_records(records)
+        seed = abs(hash(airport)) % (2**32)
+        seeds.append(seed)
+        rng = np.random.default_rng(seed)
+        iata = _icao_to_iata(airport)
+        departures = np.maximum(rng.normal(350, 40, len(days)).astype(int), 50)
+        arrivals = np.maximum(rng.normal(340, 40, len(days)).astype(int), 50)
+        cancel_rate = 0.02 + 0.01 * rng.random(len(days))
+        divert_rate = 0.005 * rng.random(len(days))
+
+        # Segments alternate departures/arrivals for each day in order.
+        segment_sizes = np.column_stack([departures, arrivals]).ravel()
+        is_departure = np.tile([True, False], len(days))
+        total = int(segment_sizes.sum())
+        departing = np.repeat(is_departure, segment_sizes)
+        columns["FlightDate"].append(np.repeat(np.repeat(days, 2), segment_sizes))
+        columns["Origin"].append(np.where(departing, iata, "ZZZ"))
+        columns["Dest"].append(np.where(departing, "ZZZ", iata))
+        cancel_rates = np.repeat(np.repeat(cancel_rate, 2), segment_sizes)
+        divert_rates = np.repeat(np.repeat(divert_rate, 2), segment_sizes)
+        if use_numba:
+            # Rates stand in for the flags until the kernel samples them below.
+            columns["Cancelled"].append(cancel_rates)
+            columns["Diverted"].append(divert_rates)
+        else:
+            columns["Cancelled"].append((rng.random(total) < cancel_rates).astype(int))
+            columns["Diverted"].append((rng.random(total) < divert_rates).astype(int))
+    if not columns["FlightDate"]:
+        return pd.DataFrame(columns=list(columns))
+    data = {name: np.concatenate(parts) for name, parts in columns.items()}
+    if use_numba:
+        cancelled, diverted = _numba_otp.gen_flags(
+            np.asarray(seeds, dtype=np.int64),
+            np.array([len(part) for part in columns["Cancelled"]], dtype=np.int64),
+            data["Cancelled"],
+            data["Diverted"],
+        )
+        data["Cancelled"] = cancelled.astype(int)
+        data["Diverted"] = diverted.astype(int)
+    return pd.DataFrame(data)
+
+
+def _compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Store Origin/Dest as shared categoricals and the 0/1 outcome flags as int8.
+
+    A shared airport dtype keeps the columns comparable with each other and
+    turns downstream groupby keys into small integer codes.
+    """
+
+    airports = pd.CategoricalDtype(sorted(set(df["Origin"].unique()) | set(df["Dest"].unique())))
+    return df.astype({"Origin": airports, "Dest": airports, "Cancelled": "int8", "Diverted": "int8"})
 
 
 def fetch_otp(airports: list[str], start: str, end: str) -> pd.DataFrame:
@@ -94,47 +126,80 @@ def fetch_otp(airports: list[str], start: str, end: str) -> pd.DataFrame:
 
     try:
         df = _download_sample()
-        mask = df["Origin"].isin({_icao_to_iata(a) for a in airports}) | df["Dest"].isin(
-            {_icao_to_iata(a) for a in airports}
+        iata = frozenset(map(_icao_to_iata, airports))
+        flight_dates = df["FlightDate"].to_numpy()
+        mask = (df["Origin"].isin(iata).to_numpy() | df["Dest"].isin(iata).to_numpy()) & (
+            (flight_dates >= datetime.fromisoformat(start).date())
+            & (flight_dates <= datetime.fromisoformat(end).date())
         )
-        filtered = df.loc[mask].copy()
-        filtered = filtered[(filtered["FlightDate"] >= datetime.fromisoformat(start).date()) & (filtered["FlightDate"] <= datetime.fromisoformat(end).date())]
+        filtered = df[mask]
         if filtered.empty:
             raise ValueError("No sample data available for requested airports; using synthetic data")
-        return filtered
+        return _compact_dtypes(filtered)
     except Exception:
-        return _synthetic_rows(airports, start, end)
+        return _compact_dtypes(_synthetic_rows(airports, start, end))
 
 
 def build_daily_movements(df: pd.DataFrame, airport: str, include_canceled: bool = False) -> pd.DataFrame:
     """Aggregate OTP rows into daily movement counts for an airport."""
 
-    if df.empty:
-        return pd.DataFrame(columns=["date", "airport", "dep_count", "arr_count", "movements"])
+    return build_daily_movements_multi(df, [airport], include_canceled=include_canceled)
+
 
-    df = df.copy()
-    df["FlightDate"] = pd.to_datetime(df["FlightDate"]).dt.date
-    iata = _icao_to_iata(airport)
+def build_daily_movements_multi(
+    df: pd.DataFrame,
+    airports: Iterable[str],
+    include_canceled: bool = False,
+) -> pd.DataFrame:
+    """Aggregate OTP rows into daily movement counts for several airports.
+
+    Origin and destination are stacked into a single long frame so the whole
+    selection is counted with one groupby rather than one scan per airport.
+    Rows are restricted to the selected airports before stacking, so flights
+    to or from unselected airports never enter the long frame.
+    """
 
+    columns = ["date", "airport", "dep_count", "arr_count", "movements"]
+    airports = list(airports)
+    if df.empty or not airports:
+        return pd.DataFrame(columns=columns)
+
+    iata_lookup = {_icao_to_iata(airport): airport for airport in airports}
     if not include_canceled:
         df = df[(df["Cancelled"] == 0) & (df["Diverted"] == 0)]
 
-    dep_counts = (
-        df[df["Origin"] == iata]
-        .groupby("FlightDate")
-        .size()
-        .rename("dep_count")
-    )
-    arr_counts = (
-        df[df["Dest"] == iata]
-        .groupby("FlightDate")
-        .size()
-        .rename("arr_count")
+    flight_dates = df["FlightDate"]
+    if not pd.api.types.is_datetime64_any_dtype(flight_dates):
+        flight_dates = pd.to_datetime(flight_dates)
+    dates = flight_dates.dt.normalize().to_numpy()
+    origin = df["Origin"].map(iata_lookup).to_numpy()
+    dest = df["Dest"].map(iata_lookup).to_numpy()
+    departing = pd.notna(origin)
+    arriving = pd.notna(dest)
+    # The long frame is assembled from concatenated column arrays rather than
+    # pd.concat of two frames, which would realign and copy per block. A single
+    # boolean role column marks departures; arrivals are the remainder.
+    counts = [int(departing.sum()), int(arriving.sum())]
+    stacked = pd.DataFrame(
+        {
+            "date": np.concatenate([dates[departing], dates[arriving]]),
+            "airport": pd.Categorical(
+                np.concatenate([origin[departing], dest[arriving]]),
+                categories=list(dict.fromkeys(airports)),
+            ),
+            "departure": np.repeat([True, False], counts),
+        }
     )
 
-    daily = pd.concat([dep_counts, arr_counts], axis=1).fillna(0)
-    daily["movements"] = daily["dep_count"] + daily["arr_count"]
+    if _pl.enabled():
+        daily = _pl.daily_movements_pl(stacked)
+    else:
+        daily = stacked.groupby(["airport", "date"], observed=True)["departure"].agg(
+            dep_count="sum",
+            movements="size",
+        )
+    daily["dep_count"] = daily["dep_count"].astype("int64")
+    daily["arr_count"] = daily["movements"] - daily["dep_count"]
     daily.reset_index(inplace=True)
-    daily.rename(columns={"FlightDate": "date"}, inplace=True)
-    daily["airport"] = airport
-    return daily[["date", "airport", "dep_count", "arr_count", "movements"]]
+    daily["airport"] = daily["airport"].astype(str)
+    return daily[columns]
@@ -8,7 +8,7 @@ import numpy as np
 import pandas as pd
 import requests
 
-from src.utils.http import build_session, get_csv
+from src.utils.http import get_csv_cached
 
 BASE_URL = "https://www.tsa.gov/sites/default/files/tsa_travel_numbers.csv"
 
@@ -18,13 +18,12 @@ def _synthetic_tsa(start: str, end: str) -> pd.DataFrame:
     end_dt = datetime.fromisoformat(end)
     dates = pd.date_range(start_dt, end_dt, freq="D")
     rng = np.random.default_rng(42)
-    values = np.maximum(100000, rng.normal(2200000, 250000, size=len(dates))).astype(int)
-    return pd.DataFrame({"date": dates.date, "tsa_travelers": values})
+    values = np.maximum(100000, rng.normal(2200000, 250000, size=len(dates))).astype("int32")
+    return pd.DataFrame({"date": dates, "tsa_travelers": values})
 
 
 def _download_csv(session: requests.Session | None = None) -> pd.DataFrame:
-    http = session or build_session(None)
-    return get_csv(BASE_URL, session=http)
+    return get_csv_cached(BASE_URL, session=session)
 
 
 def fetch_tsa(start: str, end: str, session: requests.Session | None = None) -> pd.DataFrame:
@@ -39,10 +38,15 @@ def fetch_tsa(start: str, end: str, session: requests.Session | None = None) ->
             df.rename(columns={"travelers": "tsa_travelers"}, inplace=True)
         elif "tsa travel numbers" in df.columns:
             df.rename(columns={"tsa travel numbers": "tsa_travelers"}, inplace=True)
-        df["date"] = pd.to_datetime(df["date"]).dt.date
+        df["date"] = pd.to_datetime(df["date"]).dt.normalize()
         df = df[["date", "tsa_travelers"]]
-        mask = (df["date"] >= datetime.fromisoformat(start).date()) & (df["date"] <= datetime.fromisoformat(end).date())
-        filtered = df.loc[mask].copy()
+        travelers = df["tsa_travelers"]
+        # Daily counts fit comfortably in int32; leave anything with gaps or
+        # non-numeric values as parsed.
+        if pd.api.types.is_integer_dtype(travelers) and travelers.between(0, np.iinfo(np.int32).max).all():
+            df = df.astype({"tsa_travelers": "int32"})
+        mask = (df["date"] >= pd.Timestamp(start)) & (df["date"] <= pd.Timestamp(end))
+        filtered = df.loc[mask]
         if filtered.empty:
             raise ValueError("No TSA data for requested window")
         return filtered
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
 
 @dataclass(frozen=True)
 class DateWindow:
@@ -52,28 +55,50 @@ def to_datetime(value: str | datetime, tz_name: str) -> datetime:
     return parsed.astimezone(tz)
 
 
+def _as_date(value: str | date) -> date:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).date()
+    return value
+
+
+def date_range_ordinals(start: str | date, end: str | date) -> np.ndarray:
+    """Return the proleptic ordinals of each date between *start* and *end* inclusive."""
+
+    return np.arange(_as_date(start).toordinal(), _as_date(end).toordinal() + 1, dtype=np.int64)
+
+
 def date_range(start: str | date, end: str | date) -> Iterable[date]:
     """Yield each date between *start* and *end* inclusive."""
 
-    if isinstance(start, str):
-        start_date = datetime.fromisoformat(start).date()
-    else:
-        start_date = start
-    if isinstance(end, str):
-        end_date = datetime.fromisoformat(end).date()
-    else:
-        end_date = end
-    current = start_date
-    while current <= end_date:
-        yield current
-        current += timedelta(days=1)
+    return (date.fromordinal(int(ordinal)) for ordinal in date_range_ordinals(start, end))
+
+
+def day_ordinals(dates: Iterable[pd.Timestamp | date]) -> np.ndarray:
+    """Return the proleptic ordinals of the calendar days in *dates*, skipping nulls."""
+
+    values = dates if isinstance(dates, (pd.Series, pd.Index, np.ndarray)) else list(dates)
+    index = pd.DatetimeIndex(pd.to_datetime(values))
+    if index.tz is not None:
+        # Keep the local calendar day, as ``Timestamp.date()`` does.
+        index = index.tz_localize(None)
+    days = index.dropna().to_numpy().astype("datetime64[D]").astype(np.int64)
+    return days + _EPOCH_ORDINAL
 
 
 def coverage_ratio(dates: Iterable[pd.Timestamp], start: date, end: date) -> float:
     """Compute date coverage between *start* and *end* from an iterable of timestamps."""
 
-    expected = set(date_range(start, end))
-    observed = {d.date() if isinstance(d, pd.Timestamp) else d for d in dates}
-    if not expected:
+    expected = date_range_ordinals(start, end)
+    if not expected.size:
         return 0.0
-    return len(expected & observed) / len(expected)
+    return int(np.isin(expected, np.unique(day_ordinals(dates))).sum()) / expected.size
+
+
+def iter_month_chunks(df: pd.DataFrame, date_col: str) -> Iterator[pd.DataFrame]:
+    """Yield the rows of *df* one calendar month of *date_col* at a time."""
+
+    if df.empty:
+        return
+    months = pd.to_datetime(df[date_col]).dt.to_period("M")
+    for _, chunk in df.groupby(months, sort=True):
+        yield chunk
@@ -2,25 +2,46 @@
 
 from __future__ import annotations
 
+import functools
 import os
-from io import StringIO
+from pathlib import Path
 from typing import Any, Mapping
+from urllib.parse import urlencode
 
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
+import xxhash
+from pyarrow import csv as pa_csv
 from requests import Response
+from requests.adapters import HTTPAdapter
 from tenacity import retry, stop_after_attempt, wait_exponential
+from urllib3.util.request import ACCEPT_ENCODING
 
 DEFAULT_TIMEOUT = (15, 30)
 _SUCCESS_CODES = {200, 201, 202, 204}
+HTTP_POOL_SIZE = 32
+CSV_BLOCK_SIZE = 4 << 20
+HTTP_CACHE_DIR = Path(".cache") / "http"
 
 
 def build_session(user_agent: str | None = None) -> requests.Session:
-    """Create a requests session with default headers and optional User-Agent."""
+    """Create a pooled requests session with default headers and optional User-Agent.
+
+    Retries stay with the tenacity wrapper in :func:`_get`; the adapter only
+    keeps connections alive so repeated calls to the same host skip the
+    TCP/TLS handshake.
+    """
 
     session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     headers: dict[str, str] = {
         "Accept": "application/json, text/csv, */*",
+        "Accept-Encoding": ACCEPT_ENCODING,
     }
     if user_agent:
         headers["User-Agent"] = user_agent
@@ -29,6 +50,18 @@ def build_session(user_agent: str | None = None) -> requests.Session:
     return session
 
 
+@functools.lru_cache(maxsize=8)
+def shared_session(user_agent: str | None = None) -> requests.Session:
+    """Return a process-wide pooled session for *user_agent*.
+
+    Callers that do not manage their own session share these, so back-to-back
+    downloads from the same host reuse kept-alive connections instead of
+    opening a new pool per call.
+    """
+
+    return build_session(user_agent)
+
+
 def _merge_params(url: str, params: Mapping[str, Any] | None) -> dict[str, Any]:
     merged: dict[str, Any] = dict(params or {})
     api_key = os.getenv("DATA_GOV_API_KEY", "").strip()
@@ -61,24 +94,87 @@ def _raise_for_status(url: str, response: Response) -> None:
         )
 
 
-@retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=1, min=1, max=8))
-def _get(
+_with_retries = retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=1, min=1, max=8))
+
+
+def _request(
     url: str,
     params: Mapping[str, Any] | None,
     headers: Mapping[str, str] | None,
     session: requests.Session | None,
+    stream: bool = False,
+    conditional: Mapping[str, str] | None = None,
 ) -> Response:
-    http = session or build_session()
+    http = session or shared_session()
     merged_params = _merge_params(url, params)
+    # Headers are sent per request so they never stick to a shared session;
+    # a 304 is only acceptable when conditional headers were sent.
     merged_headers = _merge_headers(url, headers)
-    if merged_headers:
-        http.headers.update(merged_headers)
+    merged_headers.update(conditional or {})
     auth = _resolve_auth(url)
-    response = http.get(url, params=merged_params, timeout=DEFAULT_TIMEOUT, auth=auth)
-    _raise_for_status(url, response)
+    response = http.get(
+        url,
+        params=merged_params,
+        headers=merged_headers,
+        timeout=DEFAULT_TIMEOUT,
+        auth=auth,
+        stream=stream,
+    )
+    if not (conditional and response.status_code == 304):
+        _raise_for_status(url, response)
     return response
 
 
+@_with_retries
+def _get(
+    url: str,
+    params: Mapping[str, Any] | None,
+    headers: Mapping[str, str] | None,
+    session: requests.Session | None,
+) -> Response:
+    return _request(url, params, headers, session)
+
+
+@_with_retries
+def _get_csv_table(
+    url: str,
+    params: Mapping[str, Any] | None,
+    headers: Mapping[str, str] | None,
+    session: requests.Session | None,
+) -> pa.Table:
+    # The body is parsed while it streams in, so the retry covers the whole
+    # read rather than just the request.
+    with _request(url, params, headers, session, stream=True) as response:
+        return _read_csv_body(response)
+
+
+@_with_retries
+def _revalidate_csv_table(
+    url: str,
+    params: Mapping[str, Any] | None,
+    headers: Mapping[str, str] | None,
+    session: requests.Session | None,
+    validators: Mapping[str, str],
+) -> tuple[pa.Table | None, dict[str, str]]:
+    with _request(url, params, headers, session, stream=True, conditional=validators) as response:
+        if response.status_code == 304:
+            return None, dict(validators)
+        table = _read_csv_body(response)
+        fresh = {
+            "If-None-Match": response.headers.get("ETag"),
+            "If-Modified-Since": response.headers.get("Last-Modified"),
+        }
+        return table, {name: value for name, value in fresh.items() if value}
+
+
+def _read_csv_body(response: Response) -> pa.Table:
+    response.raw.decode_content = True
+    return pa_csv.read_csv(
+        response.raw,
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+    )
+
+
 def get_json(
     url: str,
     params: Mapping[str, Any] | None = None,
@@ -97,7 +193,47 @@ def get_csv(
     headers: Mapping[str, str] | None = None,
     session: requests.Session | None = None,
 ) -> pd.DataFrame:
-    """Fetch CSV content with retries and return a dataframe."""
+    """Fetch CSV content with retries and return a dataframe.
 
-    response = _get(url, params, headers, session)
-    return pd.read_csv(StringIO(response.text))
+    The response is streamed (transparently decompressed) into Arrow's
+    multi-threaded CSV reader, so the body is never buffered as one bytes or
+    text object, then handed to pandas.
+    """
+
+    return _get_csv_table(url, params, headers, session).to_pandas(self_destruct=True)
+
+
+def get_csv_cached(
+    url: str,
+    params: Mapping[str, Any] | None = None,
+    headers: Mapping[str, str] | None = None,
+    session: requests.Session | None = None,
+    cache_dir: str | os.PathLike[str] = HTTP_CACHE_DIR,
+) -> pd.DataFrame:
+    """Fetch CSV content like :func:`get_csv`, revalidating a Parquet copy on disk.
+
+    Parsed responses that carry an ``ETag`` or ``Last-Modified`` header are kept
+    under *cache_dir* keyed by URL and query. Later calls send them back as
+    ``If-None-Match``/``If-Modified-Since`` and read the Parquet copy on a 304
+    instead of downloading and parsing the CSV again.
+    """
+
+    root = Path(cache_dir)
+    key = xxhash.xxh3_128(f"{url}?{urlencode(sorted((params or {}).items()))}".encode()).hexdigest()
+    data_path = root / f"{key}.parquet"
+    meta_path = root / f"{key}.meta.json"
+
+    validators: dict[str, str] = {}
+    if data_path.exists() and meta_path.exists():
+        validators = orjson.loads(meta_path.read_bytes())
+
+    table, validators = _revalidate_csv_table(url, params, headers, session, validators)
+    if table is None:
+        return pq.read_table(data_path, memory_map=True).to_pandas(self_destruct=True)
+    if validators:
+        root.mkdir(parents=True, exist_ok=True)
+        partial = data_path.with_suffix(".parquet.tmp")
+        pq.write_table(table, partial, compression="zstd")
+        os.replace(partial, data_path)
+        meta_path.write_bytes(orjson.dumps(validators))
+    return table.to_pandas(self_destruct=True)
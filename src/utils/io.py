@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
-import json
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+MAX_DATASET_PARTITIONS = 1 << 16
+PARQUET_COMPRESSION = "zstd"
+PARQUET_COMPRESSION_LEVEL = 3
+PARQUET_DATA_PAGE_SIZE = 1 << 20
+PARQUET_ROW_GROUP_SIZE = 131072
+# Low-cardinality string columns stored as dictionaries so they read back as categoricals.
+PARQUET_DICTIONARY_COLUMNS = ("airport", "Origin", "Dest", "wx_string", "flight_category")
+_MANIFEST_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
 
 
 def _ensure_parent(path: Path) -> None:
@@ -17,17 +30,43 @@ def _ensure_parent(path: Path) -> None:
 
 
 def write_parquet(df: pd.DataFrame, path: str | os.PathLike[str]) -> None:
-    """Write a dataframe to a parquet file, creating directories as needed."""
+    """Write a dataframe to a zstd-compressed, dictionary-encoded parquet file.
+
+    Directories are created as needed. Known repetitive string columns are
+    dictionary-encoded before writing so readers get categoricals back, and
+    row groups are capped at ``PARQUET_ROW_GROUP_SIZE`` rows.
+    """
 
     target = Path(path)
     _ensure_parent(target)
-    df.to_parquet(target, index=False)
-
-
-def read_parquet(path: str | os.PathLike[str]) -> pd.DataFrame:
-    """Read a parquet dataset from disk."""
-
-    return pd.read_parquet(Path(path))
+    categorical = {
+        name: "category"
+        for name in PARQUET_DICTIONARY_COLUMNS
+        if name in df.columns and pd.api.types.is_string_dtype(df[name].dtype)
+    }
+    table = pa.Table.from_pandas(df.astype(categorical) if categorical else df, preserve_index=False)
+    pq.write_table(
+        table,
+        target,
+        compression=PARQUET_COMPRESSION,
+        compression_level=PARQUET_COMPRESSION_LEVEL,
+        use_dictionary=True,
+        write_statistics=True,
+        data_page_size=PARQUET_DATA_PAGE_SIZE,
+        row_group_size=PARQUET_ROW_GROUP_SIZE,
+    )
+
+
+def read_parquet(path: str | os.PathLike[str], columns: list[str] | None = None) -> pd.DataFrame:
+    """Read a parquet dataset from disk, optionally projecting *columns*.
+
+    The file is memory-mapped and only the requested columns are decoded. The
+    Arrow table is released column by column while it is converted, so the
+    read does not hold both the Arrow and pandas copies at peak.
+    """
+
+    table = pq.read_table(Path(path), columns=columns, memory_map=True, use_threads=True)
+    return table.to_pandas(self_destruct=True, split_blocks=True)
 
 
 def write_manifest(payload: dict[str, Any], path: str | os.PathLike[str]) -> None:
@@ -35,22 +74,78 @@ def write_manifest(payload: dict[str, Any], path: str | os.PathLike[str]) -> Non
 
     target = Path(path)
     _ensure_parent(target)
-    with target.open("w", encoding="utf-8") as fh:
-        json.dump(payload, fh, indent=2, sort_keys=True, default=str)
-
-
-def write_csv(df: pd.DataFrame, path: str | os.PathLike[str], *, index: bool = False) -> None:
-    """Write a dataframe to CSV, ensuring the directory exists."""
-
-    target = Path(path)
-    _ensure_parent(target)
-    df.to_csv(target, index=index)
+    target.write_bytes(orjson.dumps(payload, default=str, option=_MANIFEST_OPTIONS))
+
+
+def _dataset_format(file_format: str) -> tuple[ds.FileFormat, ds.FileWriteOptions]:
+    if file_format == "parquet":
+        fmt = ds.ParquetFileFormat()
+        return fmt, fmt.make_write_options(compression=PARQUET_COMPRESSION)
+    if file_format == "feather":
+        fmt = ds.IpcFileFormat()
+        return fmt, fmt.make_write_options(compression="lz4")
+    if file_format == "csv":
+        fmt = ds.CsvFileFormat()
+        return fmt, fmt.make_write_options()
+    raise ValueError(f"Unsupported dataset format: {file_format}")
+
+
+def write_partitioned_dataset(
+    df: pd.DataFrame | pa.Table,
+    base_dir: str | os.PathLike[str],
+    partition_cols: list[str],
+    columns: Mapping[str, Any] | None = None,
+    file_format: str = "parquet",
+) -> None:
+    """Write a dataframe or Arrow table as a hive-partitioned dataset under *base_dir*.
+
+    Partitioning is handled by Arrow's dataset writer, so every partition is
+    emitted in a single call instead of one pandas write per group. Extra
+    *columns* (e.g. derived partition keys) are attached to the Arrow table
+    directly so callers do not need to copy *df* to add them. Timestamp
+    partition columns are truncated to ``date32``. *file_format* is one of
+    ``parquet`` (zstd), ``feather`` (Arrow IPC with LZ4) or ``csv``.
+    """
+
+    root = Path(base_dir)
+    root.mkdir(parents=True, exist_ok=True)
+    table = df if isinstance(df, pa.Table) else pa.Table.from_pandas(df, preserve_index=False)
+    for name, values in (columns or {}).items():
+        column = values if isinstance(values, (pa.Array, pa.ChunkedArray)) else pa.array(values)
+        if name in table.column_names:
+            table = table.set_column(table.column_names.index(name), name, column)
+        else:
+            table = table.append_column(name, column)
+    for name in partition_cols:
+        if pa.types.is_timestamp(table.schema.field(name).type):
+            index = table.column_names.index(name)
+            table = table.set_column(index, name, pc.cast(table[name], pa.date32()))
+    partitioning = ds.partitioning(
+        pa.schema([table.schema.field(name) for name in partition_cols]),
+        flavor="hive",
+    )
+    fmt, write_options = _dataset_format(file_format)
+    ds.write_dataset(
+        table,
+        base_dir=str(root),
+        format=fmt,
+        file_options=write_options,
+        partitioning=partitioning,
+        existing_data_behavior="overwrite_or_ignore",
+        max_partitions=MAX_DATASET_PARTITIONS,
+        use_threads=True,
+    )
 
 
 def list_files(path: str | os.PathLike[str]) -> list[Path]:
     """Return a sorted list of files located under *path*."""
 
-    root = Path(path)
-    if not root.exists():
+    try:
+        # DirEntry.is_file() uses the type cached from the directory listing,
+        # avoiding a stat call per entry.
+        with os.scandir(path) as entries:
+            files = [Path(entry.path) for entry in entries if entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted(p for p in root.iterdir() if p.is_file())
+    files.sort()
+    return files
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+_RECORD_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+
 
 def log_ingest(event: dict[str, Any], log_dir: str = "logs", filename: str = "ingest.log") -> None:
     """Append an ingest event to the structured log file."""
@@ -14,5 +17,5 @@ def log_ingest(event: dict[str, Any], log_dir: str = "logs", filename: str = "in
     path = Path(log_dir) / filename
     path.parent.mkdir(parents=True, exist_ok=True)
     record = {"timestamp": datetime.utcnow().isoformat(), **event}
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(record, sort_keys=True) + "\n")
+    with path.open("ab") as handle:
+        handle.write(orjson.dumps(record, option=_RECORD_OPTIONS))
@@ -0,0 +1,45 @@
+"""Shared bootstrap for the Streamlit page scripts."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable
+
+import streamlit as st
+import toml
+
+from src.utils.secrets import get_env_bool, load_env
+
+CONFIG_PATH = Path(__file__).resolve().parents[2] / "config.toml"
+
+
+def resolve_context() -> tuple[dict[str, Any], bool]:
+    """Return the app config and admin flag for the current session.
+
+    Pages launched from ``streamlit_app`` reuse the context it stored in session
+    state; pages opened directly load ``config.toml`` from the repository root.
+    """
+
+    context = st.session_state.get("app_context")
+    if context:
+        return context["config"], context["is_admin"]
+
+    load_env()
+    with CONFIG_PATH.open("r", encoding="utf-8") as handle:
+        config = toml.load(handle)
+    return config, get_env_bool("IS_ADMIN")
+
+
+def auto_render(render: Callable[..., None]) -> None:
+    """Render a page when Streamlit executes it as a script.
+
+    The navigation fallback in ``streamlit_app`` sets ``_manual_page_render``
+    before importing a page and calls ``render`` itself, so the import must not
+    render a second time.
+    """
+
+    if st.session_state.get("_manual_page_render"):
+        return
+
+    config, is_admin = resolve_context()
+    render(config=config, is_admin=is_admin)
@@ -4,7 +4,9 @@ from __future__ import annotations
 """Plotly figure factories for the Streamlit app."""
 
 from datetime import datetime
+from enum import IntEnum
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -17,85 +19,155 @@ STATUS_COLORS = {
     "error": "#EF553B",
 }
 
-CREDENTIAL_COLORS = {
-    "success": "#00CC96",
-    "warn": "#FECB52",
-    "error": "#EF553B",
-    "info": "#AB63FA",
-}
 
-CREDENTIAL_VALUES = {
-    "success": 1.0,
-    "warn": 0.6,
-    "error": 0.15,
-    "info": 0.4,
-}
+class Severity(IntEnum):
+    """Credential severities, indexing the per-severity style tuples below."""
+
+    SUCCESS = 0
+    WARN = 1
+    ERROR = 2
+    INFO = 3
+
+
+_SEVERITIES = {severity.name.lower(): severity for severity in Severity}
+_CREDENTIAL_COLOR_BY_SEVERITY = ("#00CC96", "#FECB52", "#EF553B", "#AB63FA")
+_CREDENTIAL_VALUE_BY_SEVERITY = (1.0, 0.6, 0.15, 0.4)
+
+CREDENTIAL_COLORS = dict(zip(_SEVERITIES, _CREDENTIAL_COLOR_BY_SEVERITY))
+CREDENTIAL_VALUES = dict(zip(_SEVERITIES, _CREDENTIAL_VALUE_BY_SEVERITY))
+
+# Longer series are min/max-downsampled before they are sent to the browser.
+TIMESERIES_MAX_POINTS = 1000
+# The factories below only build figures from trusted, fixed property names, so
+# Plotly's pure-Python property validation is switched off for them.
+_NO_VALIDATE = {"_validate": False}
+
+
+_INDICATOR_MARGIN = {"l": 10, "r": 10, "t": 40, "b": 10}
+
+
+def _without_validation(fig: go.Figure) -> go.Figure:
+    """Skip property validation for later updates of a figure built elsewhere."""
+
+    fig._validate = False
+    return fig
 
 
 def indicator_card(title: str, value: float | int | str, suffix: str = "") -> go.Figure:
-    """Return a Plotly indicator card."""
+    """Return a Plotly indicator card.
+
+    The figure is built from a plain dict in one constructor call rather than
+    by assembling and then patching graph objects.
+    """
+
+    trace = {
+        "type": "indicator",
+        "mode": "number",
+        "value": value if isinstance(value, (int, float)) else None,
+        "number": {"suffix": suffix},
+        "title": {"text": title},
+    }
+    layout: dict = {"margin": dict(_INDICATOR_MARGIN)}
+    if isinstance(value, str):
+        trace["number"]["valueformat"] = ""
+        layout["annotations"] = [{"text": value, "showarrow": False, "font": {"size": 32}}]
+    return go.Figure({"data": [trace], "layout": layout}, **_NO_VALIDATE)
 
-    fig = go.Figure(
-        go.Indicator(
-            mode="number",
-            value=value if isinstance(value, (int, float)) else None,
-            number={"suffix": suffix},
-            title={"text": title},
-        )
+
+def kpi_indicators(kpis: list[tuple[str, float | int, str]]) -> go.Figure:
+    """Render ``(title, value, suffix)`` KPIs side by side in one Plotly figure."""
+
+    if not kpis:
+        return go.Figure(**_NO_VALIDATE)
+
+    fig = _without_validation(make_subplots(rows=1, cols=len(kpis), specs=[[{"type": "indicator"} for _ in kpis]]))
+    fig.add_traces(
+        [
+            go.Indicator(mode="number", value=value, number={"suffix": suffix}, title={"text": title}, **_NO_VALIDATE)
+            for title, value, suffix in kpis
+        ],
+        rows=[1] * len(kpis),
+        cols=list(range(1, len(kpis) + 1)),
     )
-    if isinstance(value, str):
-        fig.data[0].mode = "number"
-        fig.data[0].value = None
-        fig.data[0].number = {"suffix": suffix, "valueformat": ""}
-        fig.add_annotation(text=value, showarrow=False, font=dict(size=32))
     fig.update_layout(margin=dict(l=10, r=10, t=40, b=10))
     return fig
 
 
-def status_timeline(steps: list[dict]) -> go.Figure:
-    """Render a timeline showing ingest progress steps."""
+def status_timeline(steps: list[dict], now: datetime | None = None) -> go.Figure:
+    """Render a timeline showing ingest progress steps.
+
+    Unfinished steps are measured up to *now*, which must come from the same
+    clock as the steps' ``t_start``; it defaults to naive UTC like the ingest page.
+    """
 
     if not steps:
-        return go.Figure()
+        return go.Figure(**_NO_VALIDATE)
 
     names = [step["name"] for step in steps]
     starts = [step.get("t_start") for step in steps]
-    finishes = [step.get("t_end", datetime.now()) for step in steps]
-    durations = [max((finish - start).total_seconds(), 0.1) for start, finish in zip(starts, finishes)]
-    colors = [STATUS_COLORS.get(step.get("status", "pending"), STATUS_COLORS["pending"]) for step in steps]
-
+    # Every unfinished step is measured against the same instant.
+    now = now or datetime.utcnow()
+    finishes = [step.get("t_end") or now for step in steps]
+    durations = np.maximum([(finish - start).total_seconds() for start, finish in zip(starts, finishes)], 0.1)
+    statuses = [step.get("status", "pending") for step in steps]
+    colors = [STATUS_COLORS.get(status, STATUS_COLORS["pending"]) for status in statuses]
+
+    # Hover labels are formatted in the browser from customdata rather than
+    # assembled as one string per step here.
     fig = go.Figure(
         go.Bar(
             x=durations,
             y=names,
             orientation="h",
             marker_color=colors,
-            text=[step.get("status", "pending").title() for step in steps],
-            hovertext=[
-                f"Start: {start}<br>End: {finish}<br>Status: {step.get('status')}"
-                for start, finish, step in zip(starts, finishes, steps)
-            ],
-            hoverinfo="text",
-        )
+            text=[status.title() for status in statuses],
+            customdata=np.array([starts, finishes, [step.get("status") for step in steps]], dtype=object).T,
+            hovertemplate="Start: %{customdata[0]}<br>End: %{customdata[1]}<br>Status: %{customdata[2]}<extra></extra>",
+            **_NO_VALIDATE,
+        ),
+        **_NO_VALIDATE,
     )
     fig.update_layout(
-        xaxis_title="Duration (s)",
-        yaxis_title="Step",
+        # Spelled out in full: unvalidated figures do not expand magic
+        # underscores or string titles.
+        xaxis={"title": {"text": "Duration (s)"}},
+        yaxis={"title": {"text": "Step"}},
         margin=dict(l=100, r=10, t=10, b=40),
         height=300,
     )
     return fig
 
 
+def _minmax_downsample(x: np.ndarray, y: np.ndarray, max_points: int) -> tuple[np.ndarray, np.ndarray]:
+    """Keep the endpoints and each bucket's minimum and maximum of a long series."""
+
+    if len(y) <= max_points:
+        return x, y
+    values = y.astype(float)
+    edges = np.linspace(0, len(values), max_points // 2 + 1).astype(int)
+    keep = [0, len(values) - 1]
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        bucket = values[lo:hi]
+        if bucket.size and not np.isnan(bucket).all():
+            keep.extend((lo + int(np.nanargmin(bucket)), lo + int(np.nanargmax(bucket))))
+    index = np.unique(keep)
+    return x[index], y[index]
+
+
 def mini_timeseries(df: pd.DataFrame, x: str = "date", y: str = "value", title: str = "") -> go.Figure:
-    """Render a compact timeseries line chart."""
+    """Render a compact timeseries line chart.
+
+    Series longer than ``TIMESERIES_MAX_POINTS`` are reduced to per-bucket
+    extremes so peaks survive while the payload stays bounded.
+    """
 
-    fig = go.Figure()
+    fig = go.Figure(**_NO_VALIDATE)
     if not df.empty and x in df.columns and y in df.columns:
+        xs, ys = _minmax_downsample(df[x].to_numpy(), df[y].to_numpy(), TIMESERIES_MAX_POINTS)
         fig.add_trace(
-            go.Scatter(x=df[x], y=df[y], mode="lines+markers", line=dict(width=2))
+            go.Scattergl(x=xs, y=ys, mode="lines+markers", line=dict(width=2), **_NO_VALIDATE)
         )
-    fig.update_layout(margin=dict(l=20, r=20, t=40, b=20), height=260, title=title)
+    fig.update_layout(margin=dict(l=20, r=20, t=40, b=20), height=260, title={"text": title})
     return fig
 
 
@@ -103,16 +175,23 @@ def build_credential_indicators(statuses: list[dict[str, str]]) -> go.Figure:
     """Render credential status indicators as a single Plotly figure."""
 
     if not statuses:
-        return go.Figure()
+        return go.Figure(**_NO_VALIDATE)
 
     cols = len(statuses)
-    fig = make_subplots(rows=1, cols=cols, specs=[[{"type": "indicator"} for _ in range(cols)]], horizontal_spacing=0.12)
+    fig = _without_validation(
+        make_subplots(rows=1, cols=cols, specs=[[{"type": "indicator"} for _ in range(cols)]], horizontal_spacing=0.12)
+    )
 
-    for idx, status in enumerate(statuses, start=1):
-        severity = status.get("severity", "info")
-        color = CREDENTIAL_COLORS.get(severity, CREDENTIAL_COLORS["info"])
-        value = CREDENTIAL_VALUES.get(severity, CREDENTIAL_VALUES["info"])
-        fig.add_trace(
+    # Traces and annotations are collected first and attached in one call each;
+    # per-item add_* calls revalidate the growing layout every time.
+    traces: list[go.Indicator] = []
+    annotations: list[dict] = []
+    centers = ((np.arange(cols) + 0.5) / cols).tolist()
+    for column, (column_center, status) in enumerate(zip(centers, statuses)):
+        severity = _SEVERITIES.get(status.get("severity", "info"), Severity.INFO)
+        color = _CREDENTIAL_COLOR_BY_SEVERITY[severity]
+        value = _CREDENTIAL_VALUE_BY_SEVERITY[severity]
+        traces.append(
             go.Indicator(
                 mode="gauge",
                 value=value,
@@ -122,33 +201,37 @@ def build_credential_indicators(statuses: list[dict[str, str]]) -> go.Figure:
                     "bar": {"color": color},
                     "bgcolor": "rgba(255, 255, 255, 0.08)",
                 },
-                domain={"row": 0, "column": idx - 1},
-            ),
-            row=1,
-            col=idx,
-        )
-        column_center = (idx - 0.5) / cols
-        fig.add_annotation(
-            x=column_center,
-            y=0.85,
-            text=f"<b>{status.get('name', '')}</b>",
-            showarrow=False,
-            font=dict(size=14),
-        )
-        fig.add_annotation(
-            x=column_center,
-            y=0.6,
-            text=f"<span style='color:{color};font-size:13px'>{status.get('status', '').title()}</span>",
-            showarrow=False,
+                domain={"row": 0, "column": column},
+                **_NO_VALIDATE,
+            )
         )
-        fig.add_annotation(
-            x=column_center,
-            y=0.32,
-            text=f"<span style='font-size:11px'>{status.get('message', '')}</span>",
-            showarrow=False,
+        annotations.extend(
+            [
+                dict(
+                    x=column_center,
+                    y=0.85,
+                    text=f"<b>{status.get('name', '')}</b>",
+                    showarrow=False,
+                    font=dict(size=14),
+                ),
+                dict(
+                    x=column_center,
+                    y=0.6,
+                    text=f"<span style='color:{color};font-size:13px'>{status.get('status', '').title()}</span>",
+                    showarrow=False,
+                ),
+                dict(
+                    x=column_center,
+                    y=0.32,
+                    text=f"<span style='font-size:11px'>{status.get('message', '')}</span>",
+                    showarrow=False,
+                ),
+            ]
         )
+    fig.add_traces(traces, rows=[1] * cols, cols=list(range(1, cols + 1)))
 
     fig.update_layout(
+        annotations=annotations,
         margin=dict(l=20, r=20, t=20, b=10),
         height=220,
         paper_bgcolor="rgba(0,0,0,0)",
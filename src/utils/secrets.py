@@ -2,31 +2,38 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 from typing import Iterable
 
 from pathlib import Path
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
 _EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 _TRUE_VALUES = {"1", "true", "yes", "y", "on"}
+# Streamlit can execute pages from nested working directories, so the default
+# ``.env`` is resolved once relative to this module rather than the cwd.
+_DEFAULT_DOTENV = Path(__file__).resolve().parents[2] / ".env"
 
 
+@functools.lru_cache(maxsize=4)
 def load_env(dotenv_path: str | None = None) -> None:
     """Load environment variables from a .env file if present.
 
-    Streamlit can execute pages from nested working directories, so we resolve the
-    repository root relative to this module to locate the default ``.env`` file.
+    Existing variables are never overridden, so each path is only loaded once
+    per process; later calls are cache hits.
     """
 
     if dotenv_path is None:
-        repo_root = Path(__file__).resolve().parents[2]
-        candidate = repo_root / ".env"
-        dotenv_path = str(candidate) if candidate.exists() else None
+        dotenv_path = str(_DEFAULT_DOTENV) if _DEFAULT_DOTENV.exists() else None
 
-    load_dotenv(dotenv_path=dotenv_path, override=False)
+    # Parse once and apply in a single pass; setdefault keeps the
+    # override=False semantics of load_dotenv.
+    for key, value in dotenv_values(dotenv_path).items():
+        if value is not None:
+            os.environ.setdefault(key, value)
 
 
 def get_env_bool(name: str, default: bool = False) -> bool:
@@ -69,8 +76,13 @@ def optional_env(keys: Iterable[str]) -> dict[str, str]:
     return values
 
 
+@functools.lru_cache(maxsize=1)
 def validate_credentials() -> list[dict[str, str]]:
-    """Inspect credential-related environment variables and summarize their status."""
+    """Inspect credential-related environment variables and summarize their status.
+
+    The environment is only read from ``.env`` at startup, so the summary is
+    computed once per process. Callers should treat the result as read-only.
+    """
 
     load_env()
     statuses: list[dict[str, str]] = []
@@ -92,7 +104,9 @@ def validate_credentials() -> list[dict[str, str]]:
         )
 
     noaa_user_agent = os.getenv("NOAA_USER_AGENT", "").strip()
-    if _EMAIL_PATTERN.match(noaa_user_agent):
+    # Cheap structural checks reject the common empty / no-domain values
+    # before the regex runs.
+    if "@" in noaa_user_agent and "." in noaa_user_agent.rsplit("@", 1)[-1] and _EMAIL_PATTERN.match(noaa_user_agent):
         statuses.append(
             {
                 "name": "NOAA User-Agent", "status": "OK", "severity": "success",
@@ -3,18 +3,38 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Literal
+from typing import Any, Literal, Sequence
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel
 
-from src.utils.dates import coverage_ratio, date_range
+from src.utils.dates import coverage_ratio, date_range_ordinals, day_ordinals
 
 Status = Literal["pass", "warn", "fail"]
 
+_OTP_COLUMNS = ("FlightDate", "Origin", "Dest", "Cancelled", "Diverted")
+_OTP_DAILY_COLUMNS = ("date", "airport", "dep_count", "arr_count", "movements")
+_METAR_DAILY_COLUMNS = (
+    "date",
+    "airport",
+    "wind_mean",
+    "gust_max",
+    "vis_min",
+    "ceiling_min",
+    "precip_any",
+    "ts_any",
+    "ifr_any",
+)
+_TSA_COLUMNS = ("date", "tsa_travelers")
+
 
 class CheckResult(BaseModel):
-    """Outcome for a validation check."""
+    """Outcome for a validation check.
+
+    The check helpers below build results with ``model_construct``: their
+    fields are already well-typed, so pydantic validation is skipped.
+    """
 
     name: str
     status: Status
@@ -23,16 +43,20 @@ class CheckResult(BaseModel):
     expected: Any | None = None
 
 
-def _schema_check(name: str, df: pd.DataFrame, required: list[str]) -> CheckResult:
-    missing = [col for col in required if col not in df.columns]
+def _schema_check(name: str, df: pd.DataFrame, required: Sequence[str]) -> CheckResult:
+    present = set(df.columns)
+    missing = [col for col in required if col not in present]
     status: Status = "pass" if not missing else "fail"
     message = "Schema OK" if not missing else f"Missing columns: {', '.join(missing)}"
-    return CheckResult(name=name, status=status, message=message, value=list(df.columns), expected=required)
+    return CheckResult.model_construct(name=name, status=status, message=message, value=list(df.columns), expected=list(required))
 
 
 def _null_check(name: str, df: pd.DataFrame) -> CheckResult:
-    total = df.size if not df.empty else 1
-    nulls = int(df.isna().sum().sum())
+    if df.empty:
+        return CheckResult.model_construct(name=name, status="pass", message=f"Null ratio: {0.0:.2%}", value=0.0, expected="<5%")
+    total = df.size
+    # One reduction over the packed boolean block instead of per-column sums.
+    nulls = int(np.count_nonzero(df.isna().to_numpy()))
     ratio = nulls / total
     if ratio == 0:
         status: Status = "pass"
@@ -41,41 +65,52 @@ def _null_check(name: str, df: pd.DataFrame) -> CheckResult:
     else:
         status = "fail"
     message = f"Null ratio: {ratio:.2%}"
-    return CheckResult(name=name, status=status, message=message, value=ratio, expected="<5%")
+    return CheckResult.model_construct(name=name, status=status, message=message, value=ratio, expected="<5%")
 
 
 def _duplicate_check(name: str, df: pd.DataFrame, subset: list[str]) -> CheckResult:
-    duplicates = int(df.duplicated(subset=subset).sum())
+    duplicates = int(np.count_nonzero(df.duplicated(subset=subset).to_numpy()))
     status: Status = "pass" if duplicates == 0 else "fail"
     message = "No duplicates" if duplicates == 0 else f"{duplicates} duplicate rows"
-    return CheckResult(name=name, status=status, message=message, value=duplicates, expected=0)
+    return CheckResult.model_construct(name=name, status=status, message=message, value=duplicates, expected=0)
 
 
 def _value_range_check(name: str, series: pd.Series, minimum: float, maximum: float) -> CheckResult:
     if series.empty:
-        return CheckResult(name=name, status="warn", message="Series empty", value=None, expected=f"{minimum}-{maximum}")
-    below = (series < minimum).sum()
-    above = (series > maximum).sum()
+        return CheckResult.model_construct(name=name, status="warn", message="Series empty", value=None, expected=f"{minimum}-{maximum}")
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    out_of_range = int(np.count_nonzero((values < minimum) | (values > maximum)))
+    # The below/above split is only needed when something is out of range.
+    below = int(np.count_nonzero(values < minimum)) if out_of_range else 0
+    above = out_of_range - below
     total = len(series)
-    if below == 0 and above == 0:
+    if out_of_range == 0:
         status: Status = "pass"
         message = "Within expected range"
-    elif (below + above) / total < 0.05:
+    elif out_of_range / total < 0.05:
         status = "warn"
-        message = f"{below + above} values out of range"
+        message = f"{out_of_range} values out of range"
     else:
         status = "fail"
-        message = f"{below + above} values out of range"
-    return CheckResult(name=name, status=status, message=message, value={"below": int(below), "above": int(above)}, expected=f"{minimum}-{maximum}")
+        message = f"{out_of_range} values out of range"
+    return CheckResult.model_construct(name=name, status=status, message=message, value={"below": below, "above": above}, expected=f"{minimum}-{maximum}")
 
 
 def _coverage_check(name: str, df: pd.DataFrame, start: datetime, end: datetime) -> CheckResult:
     if df.empty or "date" not in df.columns:
-        return CheckResult(name=name, status="fail", message="Missing date coverage", value=0.0, expected=1.0)
-    ratio = coverage_ratio(pd.to_datetime(df["date"]), start.date(), end.date())
+        return CheckResult.model_construct(name=name, status="fail", message="Missing date coverage", value=0.0, expected=1.0)
+    ratio = coverage_ratio(df["date"], start.date(), end.date())
     status: Status = "pass" if ratio >= 0.95 else ("warn" if ratio >= 0.75 else "fail")
     message = f"Coverage: {ratio:.1%}"
-    return CheckResult(name=name, status=status, message=message, value=ratio, expected=">=95%")
+    return CheckResult.model_construct(name=name, status=status, message=message, value=ratio, expected=">=95%")
+
+
+def _parse_dates(df: pd.DataFrame) -> pd.DataFrame:
+    if df.empty:
+        return df
+    if "date" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        return df.assign(date=pd.to_datetime(df["date"]))
+    return df
 
 
 def run_all_checks(datasets: dict[str, pd.DataFrame], params: dict) -> list[CheckResult]:
@@ -86,24 +121,16 @@ def run_all_checks(datasets: dict[str, pd.DataFrame], params: dict) -> list[Chec
     end = datetime.fromisoformat(params["end"]) if isinstance(params["end"], str) else params["end"]
 
     otp_raw = datasets.get("otp", pd.DataFrame())
-    otp_daily = datasets.get("otp_daily", pd.DataFrame())
-    metar_daily = datasets.get("metar_daily", pd.DataFrame())
-    tsa_daily = datasets.get("tsa_daily", pd.DataFrame())
-
-    results.append(_schema_check("OTP schema", otp_raw, ["FlightDate", "Origin", "Dest", "Cancelled", "Diverted"]))
-    results.append(_schema_check("OTP daily schema", otp_daily, ["date", "airport", "dep_count", "arr_count", "movements"]))
-    results.append(_schema_check("METAR daily schema", metar_daily, [
-        "date",
-        "airport",
-        "wind_mean",
-        "gust_max",
-        "vis_min",
-        "ceiling_min",
-        "precip_any",
-        "ts_any",
-        "ifr_any",
-    ]))
-    results.append(_schema_check("TSA schema", tsa_daily, ["date", "tsa_travelers"]))
+    # Daily date columns are parsed once here and reused by the coverage and
+    # overlap checks below.
+    otp_daily = _parse_dates(datasets.get("otp_daily", pd.DataFrame()))
+    metar_daily = _parse_dates(datasets.get("metar_daily", pd.DataFrame()))
+    tsa_daily = _parse_dates(datasets.get("tsa_daily", pd.DataFrame()))
+
+    results.append(_schema_check("OTP schema", otp_raw, _OTP_COLUMNS))
+    results.append(_schema_check("OTP daily schema", otp_daily, _OTP_DAILY_COLUMNS))
+    results.append(_schema_check("METAR daily schema", metar_daily, _METAR_DAILY_COLUMNS))
+    results.append(_schema_check("TSA schema", tsa_daily, _TSA_COLUMNS))
 
     results.append(_null_check("OTP nulls", otp_raw))
     results.append(_null_check("METAR nulls", metar_daily))
@@ -134,14 +161,14 @@ def run_all_checks(datasets: dict[str, pd.DataFrame], params: dict) -> list[Chec
         results.append(_value_range_check("TSA travelers", tsa_daily["tsa_travelers"], 1000, 4000000))
 
     if not otp_daily.empty and not metar_daily.empty and not tsa_daily.empty:
-        dates = set(pd.to_datetime(otp_daily["date"]).dt.date)
-        dates &= set(pd.to_datetime(metar_daily["date"]).dt.date)
-        dates &= set(pd.to_datetime(tsa_daily["date"]).dt.date)
-        expected = set(date_range(start.date(), end.date()))
-        ratio = len(dates) / len(expected) if expected else 0
+        # Intersect int64 day ordinals rather than sets of Python date objects.
+        shared = np.intersect1d(day_ordinals(otp_daily["date"]), day_ordinals(metar_daily["date"]))
+        shared = np.intersect1d(shared, day_ordinals(tsa_daily["date"]))
+        expected = date_range_ordinals(start.date(), end.date())
+        ratio = shared.size / expected.size if expected.size else 0
         status: Status = "pass" if ratio >= 0.8 else ("warn" if ratio >= 0.5 else "fail")
         results.append(
-            CheckResult(
+            CheckResult.model_construct(
                 name="Cross-dataset date overlap",
                 status=status,
                 message=f"Shared coverage: {ratio:.1%}",